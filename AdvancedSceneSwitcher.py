@@ -1,11 +1,18 @@
 import json
 import time
+import copy
+import contextlib
+import array
+import csv
+import math
+import collections
+import datetime
 import uuid
 import threading
 import websocket
 import tkinter as tk
 import ctypes
-from tkinter import ttk, simpledialog
+from tkinter import ttk, simpledialog, filedialog
 import os
 
 # OBS WebSocket Config
@@ -19,6 +26,18 @@ ws = None
 # Add these constants near the top with other configs
 SETTINGS_FILE = "obs_scene_switcher_settings.json"
 
+# Number of bulk edits that can be undone
+UNDO_LIMIT = 50
+
+# Number of on-air switches kept in the history ring buffer
+HISTORY_CAPACITY = 100000
+
+# Seconds a rotation's switch request waits for OBS to confirm it
+PENDING_SWITCH_TIMEOUT = 5.0
+
+# OBS WebSocket event subscription bits (General | Scenes | MediaInputs)
+EVENT_SUBSCRIPTIONS = 1 | 4 | 256
+
 # Minimize console window
 def minimize_console():
     """Minimize console"""
@@ -37,6 +56,295 @@ def get_auth_response(password, challenge, salt):
     auth_response = hashlib.sha256((base64.b64encode(hashed_secret).decode() + challenge).encode()).digest()
     return base64.b64encode(auth_response).decode()
 
+class SceneSearchIndex:
+    """Prefix trie plus n-gram index over scene and group names.
+
+    A query matches any name containing it, ignoring case. Queries shorter
+    than NGRAM_SIZE are answered by a shallow trie over every position in
+    each name, longer ones by intersecting n-gram postings. Each caller
+    keeps its own last result so a query that extends the previous one
+    only narrows that result instead of searching again.
+    """
+    NGRAM_SIZE = 3
+
+    def __init__(self):
+        self.names = set()
+        self.trie = {'names': set(), 'next': {}}
+        self.ngrams = {}
+        self.last_results = {}  # caller key -> (query, set of names)
+
+    def grams(self, text):
+        n = self.NGRAM_SIZE
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def matches(self, name, query):
+        """Check a single name against a lowercase query"""
+        return query in name.lower()
+
+    def trie_paths(self, text):
+        """Substrings the trie stores for text, only as deep as short queries need"""
+        depth = self.NGRAM_SIZE - 1
+        return [text[i:i + depth] for i in range(len(text))]
+
+    def add(self, name):
+        if name in self.names:
+            return
+        self.names.add(name)
+        text = name.lower()
+        for path in self.trie_paths(text):
+            node = self.trie
+            for ch in path:
+                node = node['next'].setdefault(ch, {'names': set(), 'next': {}})
+                node['names'].add(name)
+        for gram in self.grams(text):
+            self.ngrams.setdefault(gram, set()).add(name)
+        for query, results in self.last_results.values():
+            if self.matches(name, query):
+                results.add(name)
+
+    def remove(self, name):
+        if name not in self.names:
+            return
+        self.names.discard(name)
+        text = name.lower()
+        for chars in self.trie_paths(text):
+            path = [self.trie]
+            for ch in chars:
+                node = path[-1]['next'].get(ch)
+                if node is None:
+                    break
+                node['names'].discard(name)
+                path.append(node)
+            # Prune branches that no longer lead to any name
+            for parent, ch in zip(reversed(path[:-1]), reversed(chars[:len(path) - 1])):
+                child = parent['next'][ch]
+                if child['names'] or child['next']:
+                    break
+                del parent['next'][ch]
+        for gram in self.grams(text):
+            postings = self.ngrams.get(gram)
+            if postings is not None:
+                postings.discard(name)
+                if not postings:
+                    del self.ngrams[gram]
+        for query, results in self.last_results.values():
+            results.discard(name)
+
+    def sync(self, names):
+        """Bring the index in line with names, touching only what changed"""
+        names = set(names)
+        for name in self.names - names:
+            self.remove(name)
+        for name in names - self.names:
+            self.add(name)
+
+    def lookup(self, query):
+        """Full index lookup for a lowercase query"""
+        if len(query) < self.NGRAM_SIZE:
+            node = self.trie
+            for ch in query:
+                node = node['next'].get(ch)
+                if node is None:
+                    return set()
+            return set(node['names'])
+        candidates = None
+        for gram in self.grams(query):
+            postings = self.ngrams.get(gram, set())
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+        if len(query) == self.NGRAM_SIZE:
+            return candidates
+        return {name for name in candidates if query in name.lower()}
+
+    def search(self, query, key='default'):
+        """Return the set of names matching query, or None for an empty query"""
+        query = query.strip().lower()
+        if not query:
+            self.last_results.pop(key, None)
+            return None
+        previous = self.last_results.get(key)
+        # A name containing the longer query also contains the previous one
+        if previous and query.startswith(previous[0]):
+            results = {name for name in previous[1] if self.matches(name, query)}
+        else:
+            results = self.lookup(query)
+        self.last_results[key] = (query, results)
+        return set(results)
+
+class AirtimeHistory:
+    """Fixed-capacity ring buffer of on-air scene switches.
+
+    Each record is a monotonic timestamp, an interned scene id, an interned
+    group id (-1 for manual switches) and the dwell the group configured
+    (NaN for manual). A scene stays on air until the next record, so the
+    newest one is on air until now. Once full, the oldest records are
+    overwritten, keeping memory flat over long runs.
+    """
+    MANUAL = -1
+
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.capacity = capacity
+        self.timestamps = array.array('d', [0.0]) * capacity
+        self.scene_ids = array.array('i', [0]) * capacity
+        self.group_ids = array.array('i', [0]) * capacity
+        self.configured = array.array('d', [0.0]) * capacity
+        self.head = 0  # Next slot to write
+        self.count = 0
+        self.names = []  # id -> scene or group name
+        self.name_ids = {}
+        self.wall_offset = time.time() - time.monotonic()
+        self.lock = threading.Lock()
+
+    def monotonic_from_wall(self, wall_time):
+        """Convert a time.time() value into the monotonic clock records use"""
+        return wall_time - self.wall_offset
+
+    def intern(self, name):
+        if name not in self.name_ids:
+            self.name_ids[name] = len(self.names)
+            self.names.append(name)
+        return self.name_ids[name]
+
+    def record(self, scene, group_name=None, configured_dwell=None, timestamp=None):
+        """Append a switch to scene, made by group_name's rotation or manually"""
+        with self.lock:
+            slot = self.head
+            self.timestamps[slot] = time.monotonic() if timestamp is None else timestamp
+            self.scene_ids[slot] = self.intern(scene)
+            self.group_ids[slot] = self.MANUAL if group_name is None else self.intern(group_name)
+            self.configured[slot] = math.nan if configured_dwell is None else configured_dwell
+            self.head = (slot + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def slot(self, position):
+        """Buffer slot of the record at chronological position (0 = oldest)"""
+        return (self.head - self.count + position) % self.capacity
+
+    def first_position_after(self, timestamp, inclusive=False):
+        """Binary search for the first record with a timestamp above timestamp,
+        or at it when inclusive"""
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            stamp = self.timestamps[self.slot(mid)]
+            if stamp < timestamp or (stamp == timestamp and not inclusive):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def spans(self, start=None, end=None):
+        """List (timestamp, scene, group, configured dwell, on-air seconds clipped
+        to the range, actual dwell) per record in the range.
+
+        Records are copied out under the lock, so callers never hold it or
+        read slots a later record() may overwrite. group is None for manual
+        switches, and the actual dwell is None for the newest record, which
+        is still on air.
+        """
+        now = time.monotonic()
+        end = now if end is None else min(end, now)
+        spans = []
+        with self.lock:
+            # Start from the record that was on air at start, if any
+            first = 0 if start is None else max(self.first_position_after(start) - 1, 0)
+            last = self.first_position_after(end)
+            for position in range(first, last):
+                slot = self.slot(position)
+                began = self.timestamps[slot]
+                is_open = position + 1 == self.count
+                ended = now if is_open else self.timestamps[self.slot(position + 1)]
+                clipped = min(ended, end) - (began if start is None else max(began, start))
+                if clipped > 0:
+                    group_id = self.group_ids[slot]
+                    spans.append((
+                        began,
+                        self.names[self.scene_ids[slot]],
+                        None if group_id == self.MANUAL else self.names[group_id],
+                        self.configured[slot],
+                        clipped,
+                        None if is_open else ended - began
+                    ))
+        return spans
+
+    def airtime_by_scene(self, start=None, end=None):
+        totals = {}
+        for _, scene, _, _, seconds, _ in self.spans(start, end):
+            totals[scene] = totals.get(scene, 0.0) + seconds
+        return totals
+
+    def airtime_by_group(self, start=None, end=None):
+        """Airtime per rotating group, with manual switches under None"""
+        totals = {}
+        for _, _, group_name, _, seconds, _ in self.spans(start, end):
+            totals[group_name] = totals.get(group_name, 0.0) + seconds
+        return totals
+
+    def switch_counts(self, start=None, end=None):
+        """Number of times each scene went on air within [start, end)"""
+        counts = {}
+        with self.lock:
+            # Same boundaries as spans(), where a record at end has no airtime
+            first = 0 if start is None else self.first_position_after(start, inclusive=True)
+            last = self.count if end is None else self.first_position_after(end, inclusive=True)
+            for position in range(first, last):
+                scene = self.names[self.scene_ids[self.slot(position)]]
+                counts[scene] = counts.get(scene, 0) + 1
+        return counts
+
+    def dwell_report(self, start=None, end=None):
+        """Average actual dwell against configured dwell per (group, scene) in rotation.
+
+        The scene still on air has no finished dwell yet and is left out.
+        """
+        report = {}
+        for _, scene, group_name, configured, _, actual in self.spans(start, end):
+            if group_name is None or actual is None:
+                continue
+            entry = report.setdefault((group_name, scene), {'switches': 0, 'configured': 0.0, 'actual': 0.0})
+            entry['switches'] += 1
+            entry['configured'] += configured
+            entry['actual'] += actual
+        for entry in report.values():
+            entry['configured'] /= entry['switches']
+            entry['actual'] /= entry['switches']
+        return report
+
+    def records(self, start=None, end=None):
+        """Records in the range as dicts, oldest first.
+
+        actual_dwell is None (blank in CSV) for the scene still on air.
+        """
+        rows = []
+        for timestamp, scene, group_name, configured, seconds, actual in self.spans(start, end):
+            rows.append({
+                'timestamp': timestamp,
+                'wall_time': timestamp + self.wall_offset,
+                'scene': scene,
+                'group': '' if group_name is None else group_name,
+                'source': 'manual' if group_name is None else 'group',
+                'configured_dwell': None if math.isnan(configured) else configured,
+                'actual_dwell': actual,
+                'airtime': seconds
+            })
+        return rows
+
+    def export(self, path, start=None, end=None):
+        """Write records to path as JSON if it ends in .json, CSV otherwise"""
+        rows = self.records(start, end)
+        with open(path, 'w', newline='') as f:
+            if path.lower().endswith('.json'):
+                json.dump(rows, f, indent=4)
+            else:
+                writer = csv.DictWriter(f, fieldnames=[
+                    'timestamp', 'wall_time', 'scene', 'group', 'source',
+                    'configured_dwell', 'actual_dwell', 'airtime'
+                ])
+                writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+
 class OBSController:
     def __init__(self, overlay):
         self.overlay = overlay
@@ -45,6 +353,22 @@ class OBSController:
         self.active_rotations = set()
         self.current_scene = None
         self.hidden_scenes = {}  # Initialize empty dict
+        self.search_index = SceneSearchIndex()
+        self.search_var = None
+        self.scene_frame = None  # Column holding the scene buttons
+        self.scene_buttons = {}  # scene name -> button in the scene panel
+        self.panel_query = ''  # Query the panel widgets are currently filtered by
+        self.shown_scenes = set()
+        self.shown_groups = set()
+        self.picker_refreshers = []  # Callbacks of open add-scene windows
+        self.group_frames = {}  # group name -> LabelFrame in the group panel
+        self.rotation_states = {}  # group name -> wake event and awaited media input
+        self.group_listboxes = {}  # group name -> scene Listbox in the group panel
+        self.transaction_depth = 0
+        self.undo_stack = []  # (scene_groups, hidden_scenes) before each edit
+        self.history = AirtimeHistory()
+        self.pending_switches = {}  # scene -> FIFO of (requested at, group name, configured dwell)
+        self.pending_lock = threading.Lock()
         
         # Load saved settings before anything else
         self.load_settings()
@@ -54,6 +378,8 @@ class OBSController:
         self.overlay.option_add('*TLabelframe*Label.foreground', 'white')  # White text for group labels
         self.overlay.option_add('*TLabelframe.foreground', 'white')
         self.overlay.option_add('*TLabelframe.background', '#2b2b2b')
+        self.overlay.bind('<Control-z>', self.on_undo_key)
+        self.build_menu()
         
         # Add padding around the main window
         padding_frame = tk.Frame(self.overlay, bg='#2b2b2b')
@@ -71,19 +397,45 @@ class OBSController:
             secret = data['d']['authentication']['challenge']
             salt = data['d']['authentication']['salt']
             auth_response = get_auth_response(PASSWORD, secret, salt)
-            auth_payload = {'op': 1, 'd': {'rpcVersion': 1, 'authentication': auth_response, 'eventSubscriptions': 5}}
+            auth_payload = {'op': 1, 'd': {'rpcVersion': 1, 'authentication': auth_response, 'eventSubscriptions': EVENT_SUBSCRIPTIONS}}
             ws.send(json.dumps(auth_payload))
         elif data['op'] == 2:
             scene_request_payload = {'op': 6, 'd': {'resource': 'ScenesService', 'requestType': 'GetSceneList', 'requestId': str(uuid.uuid4())}}
             ws.send(json.dumps(scene_request_payload))
         elif data['op'] == 7 and data['d']['requestType'] == 'GetSceneList':
             self.scenes = [scene['sceneName'] for scene in data['d']['responseData']['scenes']]
+            # The scene live at connect time gets no change event, so start its airtime here
+            live_scene = data['d']['responseData'].get('currentProgramSceneName')
+            if live_scene and live_scene != self.current_scene:
+                self.current_scene = live_scene
+                self.history.record(live_scene)
             self.overlay.after(0, lambda: self.populate_scene_buttons())
         elif data['op'] == 5 and data['d']['eventType'] == 'CurrentProgramSceneChanged':
             current_scene = data['d']['eventData']['sceneName']
             self.current_scene = current_scene
+            self.record_switch(current_scene)
             self.update_scene_highlighting()
             self.update_overlay_visibility(current_scene)
+        elif data['op'] == 5 and data['d']['eventType'] in ('SceneCreated', 'SceneRemoved', 'SceneNameChanged'):
+            event_type = data['d']['eventType']
+            event_data = data['d']['eventData']
+            if event_data.get('isGroup'):
+                return  # OBS source groups aren't listed as scenes
+            if event_type == 'SceneCreated':
+                self.overlay.after(0, lambda: self.on_scene_created(event_data['sceneName']))
+            elif event_type == 'SceneRemoved':
+                self.overlay.after(0, lambda: self.on_scene_removed(event_data['sceneName']))
+            else:
+                self.overlay.after(0, lambda: self.on_scene_renamed(event_data['oldSceneName'], event_data['sceneName']))
+        elif data['op'] == 5 and data['d']['eventType'] == 'MediaInputPlaybackEnded':
+            self.on_media_ended(data['d']['eventData']['inputName'])
+
+    def on_media_ended(self, input_name):
+        """Wake any rotation currently waiting for this input to finish"""
+        for state in list(self.rotation_states.values()):
+            if state['input'] == input_name:
+                state['ended'] = True
+                state['wake'].set()
 
     def connect(self):
         global ws
@@ -96,7 +448,196 @@ class OBSController:
         )
         threading.Thread(target=ws.run_forever, daemon=True).start()
 
-    def send_switch_scene(self, scene_name):
+    def build_menu(self):
+        """Menu bar with the bulk edits and history export"""
+        menu_bar = tk.Menu(self.overlay)
+        
+        # Bulk actions on the scenes selected across all groups
+        edit_menu = tk.Menu(menu_bar, tearoff=0)
+        edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self.undo)
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Hide Selected", command=lambda: self.hide_scenes(self.get_selected_scenes()))
+        edit_menu.add_command(label="Unhide Selected", command=lambda: self.unhide_scenes(self.get_selected_scenes()))
+        edit_menu.add_command(label="Remove Selected", command=lambda: self.remove_scenes(self.get_selected_scenes()))
+        edit_menu.add_command(label="Move Selected To...", command=self.move_selected_scenes)
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Move Selected Up", command=lambda: self.reorder_scenes(self.get_selected_scenes(), -1))
+        edit_menu.add_command(label="Move Selected Down", command=lambda: self.reorder_scenes(self.get_selected_scenes(), 1))
+        menu_bar.add_cascade(label="Edit", menu=edit_menu)
+        
+        history_menu = tk.Menu(menu_bar, tearoff=0)
+        history_menu.add_command(label="Report...", command=self.show_history_report)
+        menu_bar.add_cascade(label="History", menu=history_menu)
+        
+        self.overlay.configure(menu=menu_bar)
+
+    def record_switch(self, scene_name):
+        """Log a program scene change, crediting the rotation that requested it"""
+        now = time.monotonic()
+        pending = None
+        with self.pending_lock:
+            queue = self.pending_switches.get(scene_name)
+            while queue:
+                requested_at, group_name, configured_dwell = queue.popleft()
+                if now - requested_at <= PENDING_SWITCH_TIMEOUT:
+                    pending = (group_name, configured_dwell)
+                    break
+            if queue is not None and not queue:
+                del self.pending_switches[scene_name]
+        if pending:
+            self.history.record(scene_name, *pending)
+        else:
+            self.history.record(scene_name)
+
+    def add_pending_switch(self, scene_name, group_name, configured_dwell):
+        """Remember a rotation's switch request until OBS reports the change"""
+        now = time.monotonic()
+        with self.pending_lock:
+            # Requests that never produced an event (e.g. the scene was already live) expire
+            for scene, queue in list(self.pending_switches.items()):
+                while queue and now - queue[0][0] > PENDING_SWITCH_TIMEOUT:
+                    queue.popleft()
+                if not queue:
+                    del self.pending_switches[scene]
+            self.pending_switches.setdefault(scene_name, collections.deque()).append(
+                (now, group_name, configured_dwell))
+
+    def export_history(self, start=None):
+        """Export history records from monotonic time start (all if None)"""
+        path = filedialog.asksaveasfilename(
+            title="Export On-Air History",
+            defaultextension='.csv',
+            filetypes=[('CSV', '*.csv'), ('JSON', '*.json')]
+        )
+        if path:
+            try:
+                count = self.history.export(path, start)
+                print(f"Exported {count} history records to {path}")
+            except Exception as e:
+                print(f"Error exporting history: {e}")
+
+    @staticmethod
+    def parse_since(text):
+        """Wall time for "HH:MM" (today) or "YYYY-MM-DD HH:MM", None if blank"""
+        text = text.strip()
+        if not text:
+            return None
+        try:
+            since = datetime.datetime.strptime(text, '%Y-%m-%d %H:%M')
+        except ValueError:
+            clock = datetime.datetime.strptime(text, '%H:%M').time()
+            since = datetime.datetime.combine(datetime.date.today(), clock)
+        return since.timestamp()
+
+    def format_history_report(self, start=None):
+        """Airtime, switch counts and dwell from monotonic time start as text"""
+        def duration(seconds):
+            minutes, seconds = divmod(int(round(seconds)), 60)
+            hours, minutes = divmod(minutes, 60)
+            return f"{hours}:{minutes:02}:{seconds:02}"
+        
+        lines = ["Airtime per scene"]
+        for scene, seconds in sorted(self.history.airtime_by_scene(start).items(), key=lambda item: -item[1]):
+            lines.append(f"  {scene:<30} {duration(seconds):>10}")
+        
+        lines += ["", "Airtime per group"]
+        for group_name, seconds in sorted(self.history.airtime_by_group(start).items(), key=lambda item: -item[1]):
+            lines.append(f"  {group_name or '(manual)':<30} {duration(seconds):>10}")
+        
+        lines += ["", "Switches per scene"]
+        for scene, count in sorted(self.history.switch_counts(start).items(), key=lambda item: -item[1]):
+            lines.append(f"  {scene:<30} {count:>10}")
+        
+        lines += ["", "Average dwell in rotation (actual / configured)"]
+        for (group_name, scene), entry in sorted(self.history.dwell_report(start).items()):
+            lines.append(f"  {group_name + ' / ' + scene:<30} {entry['actual']:>7.1f}s / {entry['configured']:.1f}s"
+                         f"  ({entry['switches']} switches)")
+        return "\n".join(lines)
+
+    def show_history_report(self):
+        report_window = tk.Toplevel(self.overlay)
+        report_window.title("On-Air History")
+        report_window.configure(bg='#2b2b2b')
+        
+        # Center the window
+        window_width = 560
+        window_height = 500
+        screen_width = report_window.winfo_screenwidth()
+        screen_height = report_window.winfo_screenheight()
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
+        report_window.geometry(f'{window_width}x{window_height}+{x}+{y}')
+        
+        controls = tk.Frame(report_window, bg='#2b2b2b')
+        controls.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Label(
+            controls,
+            text="Since (HH:MM or YYYY-MM-DD HH:MM, blank = all):",
+            bg='#2b2b2b',
+            fg='white',
+            font=('Segoe UI', 10)
+        ).pack(side=tk.LEFT)
+        
+        # Default to the start of today
+        since_var = tk.StringVar(value="00:00")
+        tk.Entry(
+            controls,
+            textvariable=since_var,
+            bg='#3c3f41',
+            fg='white',
+            insertbackground='white',
+            relief=tk.FLAT,
+            width=16
+        ).pack(side=tk.LEFT, padx=5)
+        
+        report_text = tk.Text(
+            report_window,
+            bg='#3c3f41',
+            fg='white',
+            relief=tk.FLAT,
+            font=('Consolas', 9)
+        )
+        
+        def selected_start():
+            try:
+                since = self.parse_since(since_var.get())
+            except ValueError:
+                tk.messagebox.showerror("Invalid Input", "Please enter a time as HH:MM or YYYY-MM-DD HH:MM")
+                return False, None
+            return True, None if since is None else self.history.monotonic_from_wall(since)
+        
+        def refresh():
+            valid, start = selected_start()
+            if not valid:
+                return
+            report_text.configure(state=tk.NORMAL)
+            report_text.delete('1.0', tk.END)
+            report_text.insert(tk.END, self.format_history_report(start))
+            report_text.configure(state=tk.DISABLED)
+        
+        def export():
+            valid, start = selected_start()
+            if valid:
+                self.export_history(start)
+        
+        for text, cmd in [('Refresh', refresh), ('Export...', export)]:
+            tk.Button(
+                controls,
+                text=text,
+                command=cmd,
+                bg='#4CAF50',
+                fg='white',
+                relief=tk.FLAT,
+                padx=10
+            ).pack(side=tk.LEFT, padx=(5, 0))
+        
+        report_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        refresh()
+
+    def send_switch_scene(self, scene_name, group_name=None, configured_dwell=None):
+        if group_name is not None:
+            self.add_pending_switch(scene_name, group_name, configured_dwell)
         scene_switch_payload = {'op': 6, 'd': {'resource': 'ScenesService', 'requestType': 'SetCurrentProgramScene', 'requestData': {'sceneName': scene_name}, 'requestId': str(uuid.uuid4())}}
         ws.send(json.dumps(scene_switch_payload))
         self.current_scene = scene_name
@@ -112,6 +653,7 @@ class OBSController:
         
         right_frame = tk.Frame(self.main_frame, bg='#2b2b2b')
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(5, 0))
+        self.scene_frame = right_frame
         
         # Style the add group button
         add_group_btn = tk.Button(
@@ -131,22 +673,130 @@ class OBSController:
         add_group_btn.bind('<Enter>', lambda e: add_group_btn.configure(bg=self.adjust_color('#4CAF50', -20)))
         add_group_btn.bind('<Leave>', lambda e: add_group_btn.configure(bg='#4CAF50'))
         
-        # Style scene buttons
+        # Search box filtering the scene panel and the groups
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            left_frame,
+            textvariable=self.search_var,
+            bg='#3c3f41',
+            fg='white',
+            insertbackground='white',
+            relief=tk.FLAT,
+            font=('Segoe UI', 10)
+        )
+        search_entry.pack(side=tk.TOP, fill=tk.X, pady=(0, 10))
+        self.search_var.trace_add('write', lambda *args: self.apply_search_filter())
+        
+        # Scene buttons are packed by apply_search_filter
+        self.scene_buttons = {}
         for scene in self.scenes:
-            btn = tk.Button(
-                right_frame,
-                text=scene,
-                command=lambda s=scene: self.send_switch_scene(s),
-                bg='#6a8759' if scene == self.current_scene else '#3c3f41',
-                fg='white',
-                relief=tk.FLAT,
-                font=('Segoe UI', 9),
-                padx=15,
-                pady=8
-            )
-            btn.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
-            btn.bind('<Enter>', lambda e, b=btn, s=scene: b.configure(bg='#7a9769' if s == self.current_scene else '#4a4d4f'))
-            btn.bind('<Leave>', lambda e, b=btn, s=scene: b.configure(bg='#6a8759' if s == self.current_scene else '#3c3f41'))
+            self.create_scene_button(scene)
+        
+        self.refresh_search_index()
+        self.apply_search_filter(relayout=True)
+
+    def create_scene_button(self, scene):
+        btn = tk.Button(
+            self.scene_frame,
+            text=scene,
+            command=lambda s=scene: self.send_switch_scene(s),
+            bg='#6a8759' if scene == self.current_scene else '#3c3f41',
+            fg='white',
+            relief=tk.FLAT,
+            font=('Segoe UI', 9),
+            padx=15,
+            pady=8
+        )
+        btn.bind('<Enter>', lambda e, b=btn, s=scene: b.configure(bg='#7a9769' if s == self.current_scene else '#4a4d4f'))
+        btn.bind('<Leave>', lambda e, b=btn, s=scene: b.configure(bg='#6a8759' if s == self.current_scene else '#3c3f41'))
+        self.scene_buttons[scene] = btn
+
+    def on_scene_created(self, scene_name):
+        if scene_name in self.scenes:
+            return
+        self.scenes.append(scene_name)
+        if self.scene_frame is not None:
+            self.create_scene_button(scene_name)
+        self.on_scene_list_changed()
+
+    def on_scene_removed(self, scene_name):
+        if scene_name not in self.scenes:
+            return
+        self.scenes.remove(scene_name)
+        btn = self.scene_buttons.pop(scene_name, None)
+        if btn is not None:
+            btn.destroy()
+        self.on_scene_list_changed()
+
+    def on_scene_renamed(self, old_name, new_name):
+        if old_name not in self.scenes:
+            self.on_scene_created(new_name)
+            return
+        self.scenes[self.scenes.index(old_name)] = new_name
+        btn = self.scene_buttons.pop(old_name, None)
+        if btn is not None:
+            btn.destroy()
+            self.create_scene_button(new_name)
+        self.on_scene_list_changed()
+
+    def on_scene_list_changed(self):
+        """Update only what depends on the OBS scene list after a single change"""
+        self.scene_buttons = {s: self.scene_buttons[s] for s in self.scenes if s in self.scene_buttons}
+        self.refresh_search_index()
+        self.apply_search_filter(relayout=True)
+        for refresh in list(self.picker_refreshers):
+            refresh()
+
+    def refresh_search_index(self):
+        """Sync the search index with the current scenes and groups"""
+        self.search_index.sync(set(self.scenes) | set(scene_groups))
+
+    def apply_search_filter(self, relayout=False):
+        """Show only the scene buttons and groups matching the search box.
+
+        When the query only grew, just the widgets that stopped matching are
+        hidden. Otherwise, or after the widgets were rebuilt (relayout), all
+        of them are re-packed in their original order. Hidden groups lose
+        their selection so bulk edits can't reach scenes the user can't see.
+        """
+        query = (self.search_var.get() if self.search_var else '').strip().lower()
+        matches = self.search_index.search(query, key='panel')
+        narrowing = not relayout and matches is not None and query.startswith(self.panel_query)
+        self.panel_query = query
+        
+        # A group stays visible if its name or any of its scenes match
+        def group_matches(group_name):
+            scenes = scene_groups.get(group_name, {}).get('scenes', [])
+            return matches is None or group_name in matches or any(s in matches for s in scenes)
+        
+        if narrowing:
+            for scene in [s for s in self.shown_scenes if s not in matches]:
+                self.scene_buttons[scene].pack_forget()
+                self.shown_scenes.discard(scene)
+            for group_name in [g for g in self.shown_groups if not group_matches(g)]:
+                self.group_frames[group_name].pack_forget()
+                self.group_listboxes[group_name].selection_clear(0, tk.END)
+                self.shown_groups.discard(group_name)
+            return
+        
+        # Re-pack in original order so the layout is unchanged when cleared
+        for btn in self.scene_buttons.values():
+            btn.pack_forget()
+        self.shown_scenes = set()
+        for scene, btn in self.scene_buttons.items():
+            if matches is None or scene in matches:
+                btn.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
+                self.shown_scenes.add(scene)
+        
+        for frame in self.group_frames.values():
+            frame.pack_forget()
+        self.shown_groups = set()
+        for group_name, frame in self.group_frames.items():
+            if group_matches(group_name):
+                frame.pack(fill=tk.X, pady=5)
+                self.shown_groups.add(group_name)
+            else:
+                self.group_listboxes[group_name].selection_clear(0, tk.END)
 
     def load_settings(self):
         """Load groups and hidden scenes from JSON file"""
@@ -181,12 +831,179 @@ class OBSController:
         except Exception as e:
             print(f"Error saving settings: {e}")
 
+    def snapshot_groups(self):
+        return copy.deepcopy(scene_groups), copy.deepcopy(self.hidden_scenes)
+
+    def restore_groups(self, snapshot):
+        global scene_groups
+        groups, hidden = copy.deepcopy(snapshot)
+        for group_name in list(scene_groups):
+            if group_name not in groups:
+                self.stop_scene_cycle(group_name)
+        # Rebinding keeps the snapshot's group order and is atomic for
+        # rotation threads, which look scene_groups up on every read
+        scene_groups = groups
+        self.hidden_scenes = hidden
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Apply group edits as one step with a single re-render, save and undo entry.
+
+        Nested transactions join the outermost one. If an edit raises, the
+        groups are rolled back to where the transaction started.
+        """
+        outermost = self.transaction_depth == 0
+        if outermost:
+            snapshot = self.snapshot_groups()
+            selection = self.get_selected_scenes()
+        self.transaction_depth += 1
+        try:
+            yield
+        except Exception:
+            if outermost:
+                self.restore_groups(snapshot)
+            raise
+        finally:
+            self.transaction_depth -= 1
+        
+        if outermost and self.snapshot_groups() != snapshot:
+            self.undo_stack.append(snapshot)
+            del self.undo_stack[:-UNDO_LIMIT]
+            self.reconcile_groups(selection)
+
+    def reconcile_groups(self, selection):
+        """Re-render the groups once, keep the scene selection and save"""
+        self.update_scene_groups()
+        for group_name, scenes in selection.items():
+            listbox = self.group_listboxes.get(group_name)
+            if listbox is None or group_name not in self.shown_groups:
+                continue
+            for i, scene in enumerate(scene_groups[group_name]['scenes']):
+                if scene in scenes:
+                    listbox.selection_set(i)
+        self.save_settings()
+
+    def on_undo_key(self, event):
+        # Ctrl+Z while typing in a text field shouldn't revert group edits
+        if not isinstance(event.widget, tk.Entry):
+            self.undo()
+
+    def undo(self):
+        """Revert the last group edit"""
+        if not self.undo_stack:
+            return
+        selection = self.get_selected_scenes()
+        self.restore_groups(self.undo_stack.pop())
+        self.reconcile_groups(selection)
+
+    def get_listbox_scenes(self, group_name, listbox):
+        """Scenes selected in a group's listbox"""
+        scenes = scene_groups[group_name]['scenes']
+        return [scenes[i] for i in listbox.curselection() if i < len(scenes)]
+
+    def get_selected_scenes(self):
+        """Map of group name to the scenes selected in its listbox"""
+        selection = {}
+        for group_name, listbox in self.group_listboxes.items():
+            if group_name in scene_groups and listbox.winfo_exists():
+                scenes = self.get_listbox_scenes(group_name, listbox)
+                if scenes:
+                    selection[group_name] = scenes
+        return selection
+
+    def add_scenes(self, group_name, scenes):
+        with self.transaction():
+            for scene in scenes:
+                if scene not in scene_groups[group_name]['scenes']:
+                    scene_groups[group_name]['scenes'].append(scene)
+
+    def hide_scenes(self, selection):
+        with self.transaction():
+            for group_name, scenes in selection.items():
+                self.hidden_scenes.setdefault(group_name, set()).update(scenes)
+
+    def unhide_scenes(self, selection):
+        with self.transaction():
+            for group_name, scenes in selection.items():
+                self.hidden_scenes.setdefault(group_name, set()).difference_update(scenes)
+
+    def remove_scenes(self, selection):
+        with self.transaction():
+            for group_name, scenes in selection.items():
+                details = scene_groups[group_name]
+                for scene in scenes:
+                    if scene in details['scenes']:
+                        details['scenes'].remove(scene)
+                    details.get('dwell', {}).pop(scene, None)
+                    self.hidden_scenes.get(group_name, set()).discard(scene)
+
+    def move_scenes(self, selection, target_group):
+        """Move scenes into target_group, keeping their hidden state and dwell policy"""
+        with self.transaction():
+            target = scene_groups[target_group]
+            for group_name, scenes in selection.items():
+                if group_name == target_group:
+                    continue
+                for scene in scenes:
+                    hidden = scene in self.hidden_scenes.get(group_name, set())
+                    policy = scene_groups[group_name].get('dwell', {}).get(scene)
+                    self.remove_scenes({group_name: [scene]})
+                    if scene in target['scenes']:
+                        continue
+                    target['scenes'].append(scene)
+                    if hidden:
+                        self.hidden_scenes.setdefault(target_group, set()).add(scene)
+                    if policy:
+                        target.setdefault('dwell', {})[scene] = policy
+
+    def move_selected_scenes(self):
+        selection = self.get_selected_scenes()
+        if not selection:
+            return
+        target_group = simpledialog.askstring("Move Scenes", "Move selected scenes to group:")
+        if not target_group:
+            return
+        if target_group not in scene_groups:
+            tk.messagebox.showerror("Invalid Group", f"No group named '{target_group}'")
+            return
+        self.move_scenes(selection, target_group)
+
+    def reorder_scenes(self, selection, offset):
+        """Shift the selected scenes of each group by offset positions as a block"""
+        with self.transaction():
+            for group_name, chosen in selection.items():
+                scenes = scene_groups[group_name]['scenes']
+                step = -1 if offset < 0 else 1
+                order = range(len(scenes)) if step < 0 else range(len(scenes) - 1, -1, -1)
+                for _ in range(abs(offset)):
+                    for i in order:
+                        j = i + step
+                        if scenes[i] in chosen and 0 <= j < len(scenes) and scenes[j] not in chosen:
+                            scenes[i], scenes[j] = scenes[j], scenes[i]
+
+    def clone_groups(self, group_names):
+        with self.transaction():
+            for group_name in group_names:
+                clone_name = f"{group_name} (copy)"
+                count = 2
+                while clone_name in scene_groups:
+                    clone_name = f"{group_name} (copy {count})"
+                    count += 1
+                scene_groups[clone_name] = copy.deepcopy(scene_groups[group_name])
+                self.hidden_scenes[clone_name] = set(self.hidden_scenes.get(group_name, set()))
+
+    def delete_groups(self, group_names):
+        with self.transaction():
+            for group_name in group_names:
+                self.stop_scene_cycle(group_name)
+                self.hidden_scenes.pop(group_name, None)
+                scene_groups.pop(group_name, None)
+
     def add_scene_group(self):
         group_name = simpledialog.askstring("New Scene Group", "Enter Group Name:")
         if group_name and group_name not in scene_groups:
-            scene_groups[group_name] = {'scenes': [], 'interval': 30}
-            self.update_scene_groups()
-            self.save_settings()
+            with self.transaction():
+                scene_groups[group_name] = {'scenes': [], 'interval': 30}
 
     def update_scene_groups(self):
         left_frame = None
@@ -204,6 +1021,8 @@ class OBSController:
         for widget in left_frame.winfo_children():
             if isinstance(widget, ttk.LabelFrame):
                 widget.destroy()
+        self.group_frames = {}
+        self.group_listboxes = {}
 
         # Style for group frames
         style = ttk.Style()
@@ -225,6 +1044,7 @@ class OBSController:
                 style='ActiveGroup.TLabelframe' if is_active else 'Group.TLabelframe'
             )
             frame.pack(fill=tk.X, pady=5)
+            self.group_frames[group_name] = frame
 
             # Add a visual indicator for active groups
             if is_active:
@@ -242,12 +1062,14 @@ class OBSController:
                 frame,
                 bg='#3c3f41',
                 fg='white',
-                selectmode=tk.SINGLE,
+                selectmode=tk.EXTENDED,
+                exportselection=False,  # Keep selections in several groups at once
                 font=('Segoe UI', 9),
                 relief=tk.FLAT,
                 selectbackground='#4a4d4f',
                 highlightthickness=0
             )
+            self.group_listboxes[group_name] = listbox
             listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
             
             for scene in details['scenes']:
@@ -273,12 +1095,14 @@ class OBSController:
             scene_buttons = [
                 ('Add', lambda g=group_name: self.add_scene_to_group(g)),
                 ('Remove', lambda g=group_name, lb=listbox: self.remove_scene_from_group(g, lb)),
-                ('Toggle Hide', lambda: self.toggle_hide(group_name, listbox))
+                ('Toggle Hide', lambda g=group_name, lb=listbox: self.toggle_hide(g, lb)),
+                ('Dwell', lambda g=group_name, lb=listbox: self.edit_scene_dwell(g, lb))
             ]
             
             # Group management buttons (bottom frame)
             group_buttons = [
                 ('Edit Time', lambda g=group_name: self.edit_group_time(g)),
+                ('Clone', lambda g=group_name: self.clone_groups([g])),
                 ('Delete', lambda g=group_name: self.delete_scene_group(g))
             ]
             
@@ -335,6 +1159,9 @@ class OBSController:
                 btn.pack(pady=2)
                 btn.bind('<Enter>', lambda e, b=btn: b.configure(bg=self.adjust_color('#4CAF50', -20)))
                 btn.bind('<Leave>', lambda e, b=btn: b.configure(bg='#4CAF50'))
+        
+        self.refresh_search_index()
+        self.apply_search_filter(relayout=True)
 
     def toggle_scene_cycle(self, group_name, button):
         if group_name in self.active_rotations:
@@ -402,6 +1229,18 @@ class OBSController:
             font=('Segoe UI', 20, 'bold')
         ).pack(pady=(0, 10))
         
+        # Search box filtering the tiles below
+        picker_search_var = tk.StringVar()
+        tk.Entry(
+            container,
+            textvariable=picker_search_var,
+            bg='#3c3f41',
+            fg='white',
+            insertbackground='white',
+            relief=tk.FLAT,
+            font=('Segoe UI', 10)
+        ).pack(fill=tk.X, pady=(0, 10))
+        
         # Create canvas and scrollbar for tiles
         canvas = tk.Canvas(container, bg='#2b2b2b', highlightthickness=0)
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
@@ -421,10 +1260,9 @@ class OBSController:
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         # Grid for scene tiles
-        row = 0
-        col = 0
         selected_scenes = []
         scene_buttons = {}
+        scene_tiles = {}
         
         def toggle_scene(scene, button):
             if scene in selected_scenes:
@@ -438,15 +1276,13 @@ class OBSController:
         for i in range(num_columns):
             scrollable_frame.grid_columnconfigure(i, weight=1)
         
-        # Create scene tiles
-        for scene in available_scenes:
+        def create_tile(scene):
             frame = tk.Frame(
                 scrollable_frame,
                 bg='#2b2b2b',
                 padx=5,
                 pady=5
             )
-            frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
             
             btn = tk.Button(
                 frame,
@@ -467,11 +1303,45 @@ class OBSController:
                 bg='#6a8759' if s in selected_scenes else '#3c3f41'))
             
             scene_buttons[scene] = btn
-            
-            col += 1
-            if col >= num_columns:
-                col = 0
-                row += 1
+            scene_tiles[scene] = frame
+        
+        def filter_tiles(*args):
+            # Move matching tiles together instead of rebuilding them
+            matches = self.search_index.search(picker_search_var.get(), key='picker')
+            index = 0
+            for scene, tile in scene_tiles.items():
+                if matches is None or scene in matches:
+                    tile.grid(row=index // num_columns, column=index % num_columns,
+                              padx=5, pady=5, sticky="nsew")
+                    index += 1
+                else:
+                    tile.grid_remove()
+            canvas.yview_moveto(0)
+        
+        def sync_tiles():
+            # Follow OBS scene changes while the window is open
+            if group_name not in scene_groups:
+                return
+            available = [scene for scene in self.scenes
+                         if scene not in scene_groups[group_name]['scenes']]
+            for scene in list(scene_tiles):
+                if scene not in available:
+                    scene_tiles.pop(scene).destroy()
+                    scene_buttons.pop(scene)
+                    if scene in selected_scenes:
+                        selected_scenes.remove(scene)
+            for scene in available:
+                if scene not in scene_tiles:
+                    create_tile(scene)
+            filter_tiles()
+        
+        # Create scene tiles
+        for scene in available_scenes:
+            create_tile(scene)
+        filter_tiles()
+        
+        picker_search_var.trace_add('write', filter_tiles)
+        self.picker_refreshers.append(sync_tiles)
         
         # Pack canvas and scrollbar
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -481,14 +1351,18 @@ class OBSController:
         button_container = tk.Frame(add_scene_window, bg='#2b2b2b')
         button_container.pack(fill=tk.X, padx=10, pady=10)
         
-        def confirm_selection():
-            for scene in selected_scenes:
-                if scene not in scene_groups[group_name]['scenes']:
-                    scene_groups[group_name]['scenes'].append(scene)
-            self.update_scene_groups()
-            self.save_settings()
+        # Clean up mousewheel binding and search state when window closes
+        def on_closing():
+            canvas.unbind_all("<MouseWheel>")
+            self.search_index.search('', key='picker')
+            if sync_tiles in self.picker_refreshers:
+                self.picker_refreshers.remove(sync_tiles)
             add_scene_window.destroy()
         
+        def confirm_selection():
+            self.add_scenes(group_name, selected_scenes)
+            on_closing()
+        
         # Add buttons
         tk.Button(
             button_container,
@@ -505,7 +1379,7 @@ class OBSController:
         tk.Button(
             button_container,
             text="Cancel",
-            command=add_scene_window.destroy,
+            command=on_closing,
             bg='#666666',
             fg='white',
             relief=tk.FLAT,
@@ -514,38 +1388,34 @@ class OBSController:
             pady=5
         ).pack(side=tk.LEFT, padx=5)
         
-        # Clean up mousewheel binding when window closes
-        def on_closing():
-            canvas.unbind_all("<MouseWheel>")
-            add_scene_window.destroy()
-        
         add_scene_window.protocol("WM_DELETE_WINDOW", on_closing)
 
     def remove_scene_from_group(self, group_name, listbox):
-        selected = listbox.curselection()
-        if selected:
-            scene = listbox.get(selected[0]).replace("[HIDDEN] ", "")  # Remove hidden prefix if present
-            scene_groups[group_name]['scenes'].remove(scene)
-            self.update_scene_groups()
-            self.save_settings()
+        scenes = self.get_listbox_scenes(group_name, listbox)
+        if scenes:
+            self.remove_scenes({group_name: scenes})
     
     def delete_scene_group(self, group_name):
-        if group_name in self.hidden_scenes:
-            del self.hidden_scenes[group_name]
-        del scene_groups[group_name]
-        self.update_scene_groups()
-        self.save_settings()
+        self.delete_groups([group_name])
     
     def start_scene_cycle(self, group_name):
         if group_name in self.active_rotations:
             return  # Don't start if already running
         
         self.active_rotations.add(group_name)
+        state = {'wake': threading.Event(), 'input': None, 'ended': False}
+        self.rotation_states[group_name] = state
         
         def cycle():
-            while group_name in scene_groups and group_name in self.active_rotations:
+            # A stopped rotation's thread must not carry on if the group is restarted
+            while self.rotation_states.get(group_name) is state:
+                # Read the group once, it can be deleted or restored at any time
+                details = scene_groups.get(group_name)
+                if details is None:
+                    break
+                
                 # Filter out hidden scenes during rotation
-                visible_scenes = [scene for scene in scene_groups[group_name]['scenes'] 
+                visible_scenes = [scene for scene in details['scenes'] 
                                 if scene not in self.hidden_scenes.get(group_name, set())]
                 
                 if not visible_scenes:  # Skip if all scenes are hidden
@@ -553,19 +1423,55 @@ class OBSController:
                     continue
                     
                 for scene in visible_scenes:
-                    if group_name not in self.active_rotations:
+                    details = scene_groups.get(group_name)
+                    if self.rotation_states.get(group_name) is not state or details is None:
                         break
-                    self.send_switch_scene(scene)
-                    time.sleep(scene_groups[group_name]['interval'])
+                    policy = details.get('dwell', {}).get(scene, {})
+                    # Arm the media wait before switching so a short clip can't end unseen
+                    state['wake'].clear()
+                    state['input'] = policy.get('input')
+                    state['ended'] = False
+                    configured_dwell = policy.get('max', details['interval'])
+                    self.send_switch_scene(scene, group_name, configured_dwell)
+                    self.wait_scene_dwell(group_name, policy, state, details['interval'])
             
-            if group_name in self.active_rotations:
-                self.active_rotations.remove(group_name)
+            if self.rotation_states.get(group_name) is state:
+                del self.rotation_states[group_name]
+                self.active_rotations.discard(group_name)
         
         threading.Thread(target=cycle, daemon=True).start()
 
+    def wait_scene_dwell(self, group_name, policy, state, interval):
+        """Block until the scene's dwell policy lets the rotation advance.
+
+        Without a media input the scene stays for its max time (the group
+        interval by default). With one, it advances as soon as that input's
+        playback ends, but not before min and not after max.
+        """
+        start = time.monotonic()
+        max_time = policy.get('max', interval)
+        min_time = min(policy.get('min', 0), max_time)
+        
+        while self.rotation_states.get(group_name) is state:
+            elapsed = time.monotonic() - start
+            if elapsed >= max_time:
+                break
+            if state['ended']:
+                if elapsed >= min_time:
+                    break
+                timeout = min_time - elapsed
+            else:
+                timeout = max_time - elapsed
+            # Woken early by media end or by the rotation being stopped
+            state['wake'].wait(timeout)
+            state['wake'].clear()
+
     def stop_scene_cycle(self, group_name):
         if group_name in self.active_rotations:
             self.active_rotations.remove(group_name)
+        state = self.rotation_states.pop(group_name, None)
+        if state:
+            state['wake'].set()
 
     def edit_group_time(self, group_name):
         edit_window = tk.Toplevel(self.overlay)
@@ -616,8 +1522,8 @@ class OBSController:
             try:
                 new_time = float(time_var.get())
                 if new_time > 0:
-                    scene_groups[group_name]['interval'] = new_time
-                    self.save_settings()
+                    with self.transaction():
+                        scene_groups[group_name]['interval'] = new_time
                     edit_window.destroy()
                 else:
                     tk.messagebox.showerror("Invalid Input", "Please enter a positive number")
@@ -635,6 +1541,107 @@ class OBSController:
             padx=20
         ).pack(pady=10)
 
+    def edit_scene_dwell(self, group_name, listbox):
+        """Edit how long the selected scene stays on air during rotation"""
+        scenes = self.get_listbox_scenes(group_name, listbox)
+        if not scenes:
+            return
+        if len(scenes) > 1:
+            tk.messagebox.showerror("Edit Dwell", "Select a single scene to edit its dwell")
+            return
+        scene = scenes[0]
+        policy = scene_groups[group_name].get('dwell', {}).get(scene, {})
+        
+        edit_window = tk.Toplevel(self.overlay)
+        edit_window.title(f"Edit Dwell - {scene}")
+        edit_window.configure(bg='#2b2b2b')
+        edit_window.grab_set()  # Make window modal
+        
+        # Center the window
+        window_width = 320
+        window_height = 300
+        screen_width = edit_window.winfo_screenwidth()
+        screen_height = edit_window.winfo_screenheight()
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
+        edit_window.geometry(f'{window_width}x{window_height}+{x}+{y}')
+        
+        tk.Label(
+            edit_window,
+            text=f"Group interval: {scene_groups[group_name]['interval']} seconds",
+            bg='#2b2b2b',
+            fg='white',
+            font=('Segoe UI', 10)
+        ).pack(pady=10)
+        
+        # One entry per policy field, blank means not set
+        fields = [
+            ('input', "Advance when media input ends (name):"),
+            ('min', "Minimum time (seconds):"),
+            ('max', "Maximum time (seconds, blank = interval):")
+        ]
+        field_vars = {}
+        for key, label in fields:
+            tk.Label(
+                edit_window,
+                text=label,
+                bg='#2b2b2b',
+                fg='white',
+                font=('Segoe UI', 10)
+            ).pack(pady=(0, 2))
+            field_vars[key] = tk.StringVar(value=str(policy.get(key, '')))
+            tk.Entry(
+                edit_window,
+                textvariable=field_vars[key],
+                bg='#3c3f41',
+                fg='white',
+                insertbackground='white',
+                relief=tk.FLAT
+            ).pack(pady=(0, 8), padx=20, fill=tk.X)
+        
+        def save_dwell():
+            new_policy = {}
+            input_name = field_vars['input'].get().strip()
+            if input_name:
+                new_policy['input'] = input_name
+            try:
+                for key in ('min', 'max'):
+                    value = field_vars[key].get().strip()
+                    if value:
+                        new_policy[key] = float(value)
+            except ValueError:
+                tk.messagebox.showerror("Invalid Input", "Please enter valid numbers")
+                return
+            # 0 is the default minimum, but a maximum of 0 would skip the scene
+            if new_policy.get('min', 0) < 0:
+                tk.messagebox.showerror("Invalid Input", "Minimum time can't be negative")
+                return
+            if new_policy.get('max', 1) <= 0:
+                tk.messagebox.showerror("Invalid Input", "Maximum time must be a positive number")
+                return
+            if 'min' in new_policy and 'max' in new_policy and new_policy['min'] > new_policy['max']:
+                tk.messagebox.showerror("Invalid Input", "Minimum time can't exceed maximum time")
+                return
+            
+            with self.transaction():
+                dwell = scene_groups[group_name].setdefault('dwell', {})
+                if new_policy:
+                    dwell[scene] = new_policy
+                else:
+                    dwell.pop(scene, None)
+            edit_window.destroy()
+        
+        # Save button
+        tk.Button(
+            edit_window,
+            text="Save",
+            command=save_dwell,
+            bg='#4CAF50',
+            fg='white',
+            relief=tk.FLAT,
+            padx=20
+        ).pack(pady=10)
+
     def update_scene_highlighting(self):
         # Update highlighting in scene list and groups
         for widget in self.main_frame.winfo_children():
@@ -688,24 +1695,15 @@ class OBSController:
         self.save_settings()
 
     def toggle_hide(self, group_name, listbox):
-        selected = listbox.curselection()
-        if selected:
-            scene_text = listbox.get(selected[0])
-            scene = scene_text.replace("[HIDDEN] ", "")
-            
-            if scene in self.hidden_scenes[group_name]:
-                self.hidden_scenes[group_name].remove(scene)
-                listbox.delete(selected)
-                listbox.insert(selected, scene)
-                listbox.itemconfig(selected, fg='white')
-            else:
-                self.hidden_scenes[group_name].add(scene)
-                listbox.delete(selected)
-                listbox.insert(selected, f"[HIDDEN] {scene}")
-                listbox.itemconfig(selected, fg='#666666')
-            
-            listbox.selection_set(selected)
-            self.save_settings()
+        scenes = self.get_listbox_scenes(group_name, listbox)
+        if scenes:
+            with self.transaction():
+                hidden = self.hidden_scenes.setdefault(group_name, set())
+                for scene in scenes:
+                    if scene in hidden:
+                        hidden.remove(scene)
+                    else:
+                        hidden.add(scene)
 
 # Run UI
 def main():